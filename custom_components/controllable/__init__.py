@@ -8,14 +8,53 @@ externally.
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import CONF_TARGET_ENTITY, DOMAIN
+from .const import CONF_TARGET_DEVICE, DOMAIN
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["switch"]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Controllable integration.
+
+    Registers the integration services, which are shared by all entries.
+
+    Args:
+        hass: The Home Assistant instance.
+        config: The Home Assistant configuration.
+
+    Returns:
+        True if setup was successful.
+    """
+    async_setup_services(hass)
+    return True
+
+
+def _platforms_for_entry(entry: ConfigEntry) -> list[str]:
+    """Return the platforms a config entry needs.
+
+    Entries created by the config flow always have a target device. Legacy
+    entries that only store a target entity have none, and the switch
+    platform cannot set them up, so no platform is forwarded for them.
+
+    Args:
+        entry: The config entry for this integration.
+
+    Returns:
+        The list of platforms to set up or unload.
+    """
+    if CONF_TARGET_DEVICE not in entry.data:
+        return []
+    return PLATFORMS
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Controllable from a config entry.
@@ -30,31 +69,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = entry.data
 
-    # Listen for state changes on target entities
-    @callback
-    def async_state_changed(event: Event) -> None:
-        """Handle state changes for target entities.
-
-        When a target entity changes state externally, notify the controllable
-        switches to update their sync status.
-
-        Args:
-            event: The state changed event.
-        """
-        entity_id = event.data.get("entity_id")
-        if entity_id in [
-            data[CONF_TARGET_ENTITY]
-            for data in hass.data[DOMAIN].values()
-            if CONF_TARGET_ENTITY in data
-        ]:
-            # Notify switches to update sync status
-            event_name = f"{DOMAIN}_target_changed"
-            event_data = {"entity_id": entity_id}
-            hass.bus.async_fire(event_name, event_data)
-
-    hass.bus.async_listen("state_changed", async_state_changed)
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    platforms = _platforms_for_entry(entry)
+    if platforms:
+        await hass.config_entries.async_forward_entry_setups(entry, platforms)
+    else:
+        _LOGGER.warning(
+            "Controllable %s has no target device and will not create a switch; "
+            "delete it and add it again to select a device",
+            entry.title,
+        )
     return True
 
 
@@ -68,7 +91,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Returns:
         True if unload was successful.
     """
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, _platforms_for_entry(entry)
+    )
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
     return unload_ok
@@ -6,3 +6,18 @@ CONF_TARGET_ENTITY = "target_entity"
 CONF_TARGET_DEVICE = "target_device"
 ATTR_IS_SYNCED = "is_synced"
 ATTR_TARGET_ENTITY = "target_entity"
+ATTR_LIMIT = "limit"
+
+DATA_HISTORY = f"{DOMAIN}_history"
+HISTORY_SIZE = 100
+COMMAND_CONTEXT_HISTORY = 10
+SERVICE_GET_HISTORY = "get_history"
+
+# Origins of target state changes, derived from the change's context. Changes
+# with neither a user nor a parent context are "other": physical presses,
+# integrations polling the device, and automations started by time, time
+# pattern or sun triggers all look the same.
+ORIGIN_CONTROLLABLE = "controllable"
+ORIGIN_USER = "user"
+ORIGIN_AUTOMATION = "automation"
+ORIGIN_OTHER = "other"
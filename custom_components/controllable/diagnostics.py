@@ -4,8 +4,9 @@ from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 
-from .const import DOMAIN
+from .const import DATA_HISTORY, DOMAIN
 
 
 async def async_get_config_entry_diagnostics(
@@ -13,19 +14,20 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     data = config_entry.data
-    diagnostics = {
+    diagnostics: dict[str, Any] = {
         "config_entry": {
             "entry_id": config_entry.entry_id,
             "data": data,
         },
         "entities": [],
+        "history": {},
     }
 
     # Get entities for this config entry
     for state in hass.states.async_all():
         entity_id = state.entity_id
         if entity_id.startswith(f"{DOMAIN}."):
-            diagnostics["entities"].append(  # type: ignore [attr-defined]
+            diagnostics["entities"].append(
                 {
                     "entity_id": entity_id,
                     "state": state.state,
@@ -33,4 +35,12 @@ async def async_get_config_entry_diagnostics(
                 }
             )
 
+    # Include the in-memory sync history of this entry's switches
+    histories = hass.data.get(DATA_HISTORY, {})
+    entity_reg = er.async_get(hass)
+    for entry in er.async_entries_for_config_entry(entity_reg, config_entry.entry_id):
+        history = histories.get(entry.entity_id)
+        if history is not None:
+            diagnostics["history"][entry.entity_id] = history.as_list()
+
     return diagnostics
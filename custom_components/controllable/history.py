@@ -0,0 +1,146 @@
+"""In-memory sync history for Controllable switches.
+
+Each controllable keeps a fixed-size ring buffer of target state transitions
+so overrides can be explained without querying the recorder. Records are
+stored column-wise in ``array`` buffers instead of one dict per event.
+"""
+
+from array import array
+from collections.abc import Container
+from typing import Any
+
+from homeassistant.core import Context
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ORIGIN_AUTOMATION,
+    ORIGIN_CONTROLLABLE,
+    ORIGIN_OTHER,
+    ORIGIN_USER,
+)
+
+# Index positions are the stored codes, so only append to these tuples.
+STATE_NAMES = ("off", "on", "unavailable", "unknown")
+ORIGIN_NAMES = (ORIGIN_CONTROLLABLE, ORIGIN_USER, ORIGIN_AUTOMATION, ORIGIN_OTHER)
+
+_STATE_CODES = {name: code for code, name in enumerate(STATE_NAMES)}
+_UNKNOWN_STATE = _STATE_CODES["unknown"]
+
+
+def _state_code(state: str | None) -> int:
+    """Return the stored code for a state string."""
+    if state is None:
+        return _UNKNOWN_STATE
+    return _STATE_CODES.get(state, _UNKNOWN_STATE)
+
+
+def classify_origin(context: Context, own_context_ids: Container[str]) -> str:
+    """Return who caused a target state change.
+
+    Args:
+        context: The context of the target state change.
+        own_context_ids: The context IDs of recent commands the controllable
+            sent.
+
+    Returns:
+        One of the ``ORIGIN_*`` constants.
+    """
+    if context.id in own_context_ids:
+        return ORIGIN_CONTROLLABLE
+    if context.user_id is not None:
+        return ORIGIN_USER
+    if context.parent_id is not None:
+        return ORIGIN_AUTOMATION
+    return ORIGIN_OTHER
+
+
+class SyncHistory:
+    """Fixed-size ring buffer of sync transitions.
+
+    Columns are preallocated to ``size`` entries; once full, the oldest
+    record is overwritten.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the buffer.
+
+        Args:
+            size: The maximum number of records kept.
+        """
+        if size < 1:
+            raise ValueError("History size must be at least 1")
+        self._size = size
+        self._next = 0
+        self._count = 0
+        self._timestamps = array("d", [0.0]) * size
+        self._old_states = array("b", [0]) * size
+        self._new_states = array("b", [0]) * size
+        self._synced = array("b", [0]) * size
+        self._origins = array("b", [0]) * size
+        # User IDs are strings, so they cannot live in an array column.
+        self._user_ids: list[str | None] = [None] * size
+
+    def __len__(self) -> int:
+        """Return the number of stored records."""
+        return self._count
+
+    @property
+    def size(self) -> int:
+        """Return the capacity of the buffer."""
+        return self._size
+
+    def record(
+        self,
+        timestamp: float,
+        old_state: str | None,
+        new_state: str | None,
+        is_synced: bool,
+        origin: str,
+        user_id: str | None = None,
+    ) -> None:
+        """Append a transition, overwriting the oldest one when full.
+
+        Args:
+            timestamp: The UNIX timestamp of the transition.
+            old_state: The previous target state.
+            new_state: The new target state.
+            is_synced: Whether the controllable was in sync afterwards.
+            origin: One of the ``ORIGIN_*`` constants.
+            user_id: The user that caused the change, if known.
+        """
+        i = self._next
+        self._timestamps[i] = timestamp
+        self._old_states[i] = _state_code(old_state)
+        self._new_states[i] = _state_code(new_state)
+        self._synced[i] = is_synced
+        self._origins[i] = ORIGIN_NAMES.index(origin)
+        self._user_ids[i] = user_id
+        self._next = (i + 1) % self._size
+        self._count = min(self._count + 1, self._size)
+
+    def as_list(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """Return stored records, newest first.
+
+        Args:
+            limit: The maximum number of records to return.
+
+        Returns:
+            A list of JSON serializable records.
+        """
+        count = self._count if limit is None else min(limit, self._count)
+        records = []
+        for offset in range(1, count + 1):
+            i = (self._next - offset) % self._size
+            records.append(
+                {
+                    "timestamp": dt_util.utc_from_timestamp(
+                        self._timestamps[i]
+                    ).isoformat(),
+                    "old_state": STATE_NAMES[self._old_states[i]],
+                    "new_state": STATE_NAMES[self._new_states[i]],
+                    "is_synced": bool(self._synced[i]),
+                    "origin": ORIGIN_NAMES[self._origins[i]],
+                    "user_id": self._user_ids[i],
+                }
+            )
+        return records
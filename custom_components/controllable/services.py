@@ -0,0 +1,62 @@
+"""Services for the Controllable integration."""
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+
+from .const import ATTR_LIMIT, DATA_HISTORY, DOMAIN, SERVICE_GET_HISTORY
+
+GET_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Optional(ATTR_LIMIT): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Controllable services.
+
+    Args:
+        hass: The Home Assistant instance.
+    """
+
+    @callback
+    def async_get_history(call: ServiceCall) -> ServiceResponse:
+        """Return the in-memory sync history of controllable switches.
+
+        Args:
+            call: The service call with entity IDs and an optional limit.
+
+        Returns:
+            The history records, newest first, keyed by entity ID.
+        """
+        histories = hass.data.get(DATA_HISTORY, {})
+        limit = call.data.get(ATTR_LIMIT)
+        response = {}
+        for entity_id in call.data[ATTR_ENTITY_ID]:
+            if entity_id not in histories:
+                raise ServiceValidationError(
+                    translation_domain=DOMAIN,
+                    translation_key="not_controllable",
+                    translation_placeholders={"entity_id": entity_id},
+                )
+            response[entity_id] = histories[entity_id].as_list(limit)
+        return response
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        async_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -4,22 +4,32 @@ Provides the ControllableSwitch entity that creates virtual switches
 associated with devices, controlling their main controllable entities.
 """
 
+from collections import deque
 import logging
+import time
 from typing import Any
 
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Context, Event, HomeAssistant, State, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_track_state_change_event,
+)
 
 from .const import (
     ATTR_IS_SYNCED,
     ATTR_TARGET_ENTITY,
+    COMMAND_CONTEXT_HISTORY,
     CONF_NAME,
     CONF_TARGET_DEVICE,
-    DOMAIN,
+    DATA_HISTORY,
+    HISTORY_SIZE,
+    ORIGIN_CONTROLLABLE,
 )
+from .history import SyncHistory, classify_origin
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,21 +55,6 @@ async def async_setup_entry(
     entity = ControllableSwitch(hass, config_entry.entry_id, name, target_device)
     async_add_entities([entity])
 
-    # Listen for target changes
-    if entity._target_entity:
-
-        @callback
-        def async_target_changed(event):
-            """Update sync status when target changes.
-
-            Args:
-                event: The custom event with entity_id.
-            """
-            if event.data.get("entity_id") == entity._target_entity:
-                entity.async_update_sync_status()
-
-        hass.bus.async_listen(f"{DOMAIN}_target_changed", async_target_changed)
-
 
 class ControllableSwitch(SwitchEntity):
     """Representation of a Controllable switch.
@@ -85,6 +80,8 @@ class ControllableSwitch(SwitchEntity):
         self._target_device = target_device
         self._is_synced = True  # Assume synced initially
         self._is_on: bool | None = None  # Internal state, separate from target
+        self._command_context_ids: deque[str] = deque(maxlen=COMMAND_CONTEXT_HISTORY)
+        self._history = SyncHistory(HISTORY_SIZE)
         self._attr_unique_id = f"{entry_id}_{name}"
         self._attr_name = name
         self._attr_device_class = SwitchDeviceClass.SWITCH
@@ -134,6 +131,85 @@ class ControllableSwitch(SwitchEntity):
             else:
                 self._is_on = False
 
+    async def async_added_to_hass(self) -> None:
+        """Start tracking the target entity once the switch is added."""
+        histories = self.hass.data.setdefault(DATA_HISTORY, {})
+        histories[self.entity_id] = self._history
+        self.async_on_remove(lambda: histories.pop(self.entity_id, None))
+
+        if self._target_entity:
+            self.async_on_remove(
+                async_track_state_change_event(
+                    self.hass, [self._target_entity], self._async_target_changed
+                )
+            )
+
+    @callback
+    def _async_target_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update sync status when the target entity changes state.
+
+        Args:
+            event: The state changed event for the target entity.
+        """
+        self.async_update_sync_status(event)
+
+    def _new_command_context(self) -> Context:
+        """Return the context for a command sent to the target entity.
+
+        The context carries the user and context that operated this switch.
+        Recent command context IDs are kept so delayed state changes can still
+        be attributed to this switch in the sync history.
+        """
+        if self._context:
+            context = Context(user_id=self._context.user_id, parent_id=self._context.id)
+        else:
+            context = Context()
+        self._command_context_ids.append(context.id)
+        return context
+
+    @callback
+    def _async_record_transition(
+        self,
+        event: Event[EventStateChangedData] | None,
+        target_state: State | None,
+        was_synced: bool,
+    ) -> None:
+        """Record a target state change or sync change in the history.
+
+        Attribute-only updates of the target that leave the sync status
+        unchanged are skipped so they cannot push out real transitions.
+
+        Args:
+            event: The target's state changed event, or None if the sync status
+                was updated by this switch itself.
+            target_state: The current state of the target entity.
+            was_synced: The sync status before the update.
+        """
+        if event is None:
+            if self._is_synced == was_synced:
+                return
+            old = new = target_state.state if target_state else None
+            self._history.record(
+                time.time(), old, new, self._is_synced, ORIGIN_CONTROLLABLE
+            )
+            return
+
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        old = old_state.state if old_state else None
+        new = new_state.state if new_state else None
+        if old == new and self._is_synced == was_synced:
+            return
+        context = new_state.context if new_state else event.context
+        self._history.record(
+            event.time_fired_timestamp,
+            old,
+            new,
+            self._is_synced,
+            classify_origin(context, self._command_context_ids),
+            context.user_id,
+        )
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
@@ -142,14 +218,19 @@ class ControllableSwitch(SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on.
 
-        Turns on the target entity and updates sync status.
+        Turns on the target entity and updates sync status once the target
+        has handled the command.
 
         Args:
             **kwargs: Additional arguments (unused).
         """
         self._is_on = True
         await self.hass.services.async_call(
-            "homeassistant", "turn_on", {"entity_id": self._target_entity}
+            "homeassistant",
+            "turn_on",
+            {"entity_id": self._target_entity},
+            blocking=True,
+            context=self._new_command_context(),
         )
         self.async_update_sync_status()
         self.async_write_ha_state()
@@ -157,14 +238,19 @@ class ControllableSwitch(SwitchEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off.
 
-        Turns off the target entity and updates sync status.
+        Turns off the target entity and updates sync status once the target
+        has handled the command.
 
         Args:
             **kwargs: Additional arguments (unused).
         """
         self._is_on = False
         await self.hass.services.async_call(
-            "homeassistant", "turn_off", {"entity_id": self._target_entity}
+            "homeassistant",
+            "turn_off",
+            {"entity_id": self._target_entity},
+            blocking=True,
+            context=self._new_command_context(),
         )
         self.async_update_sync_status()
         self.async_write_ha_state()
@@ -182,11 +268,20 @@ class ControllableSwitch(SwitchEntity):
         }
 
     @callback
-    def async_update_sync_status(self) -> None:
+    def async_update_sync_status(
+        self, event: Event[EventStateChangedData] | None = None
+    ) -> None:
         """Update the sync status based on current states.
 
-        Checks if the internal state matches the target entity's state.
+        Checks if the internal state matches the target entity's state and
+        records the transition in the sync history.
+
+        Args:
+            event: The target's state changed event that triggered the update,
+                if any.
         """
+        was_synced = self._is_synced
+        target_state = None
         if self._target_entity:
             target_state = self.hass.states.get(self._target_entity)
             if target_state:
@@ -196,4 +291,5 @@ class ControllableSwitch(SwitchEntity):
                 self._is_synced = False
         else:
             self._is_synced = False
+        self._async_record_transition(event, target_state, was_synced)
         self.async_write_ha_state()
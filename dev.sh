@@ -97,6 +97,19 @@ test() {
     fi
 }
 
+# Run startup benchmarks
+benchmark() {
+    print_info "Running startup benchmarks..."
+    cd "$PROJECT_DIR"
+
+    if [ -d "test_env" ]; then
+        ./test_env/bin/python -m pytest tests/test_benchmark.py -m slow -s -q "$@"
+    else
+        print_error "Test environment not found. Run tests from the main directory."
+        exit 1
+    fi
+}
+
 # Clean up the environment
 clean() {
     print_warning "This will remove all containers, volumes, and reset Home Assistant configuration."
@@ -125,6 +138,7 @@ COMMANDS:
     restart   Restart Home Assistant
     logs      Show Home Assistant logs
     test      Run the test suite
+    benchmark Report import time and setup wall time
     clean     Clean up containers and volumes
     help      Show this help message
 
@@ -133,6 +147,7 @@ EXAMPLES:
     ./dev.sh logs           # View logs
     ./dev.sh restart        # Restart after code changes
     ./dev.sh test           # Run tests
+    ./dev.sh benchmark      # Measure startup cost
     ./dev.sh clean          # Reset everything
 
 DEVELOPMENT WORKFLOW:
@@ -163,6 +178,10 @@ case "${1:-help}" in
         shift
         test "$@"
         ;;
+    benchmark)
+        shift
+        benchmark "$@"
+        ;;
     clean)
         clean
         ;;
@@ -0,0 +1,302 @@
+"""Simulated devices for end-to-end testing of the Controllable integration.
+
+Provides switch, light and fan entities backed by real device and entity
+registry entries, answering ``homeassistant.turn_on``/``turn_off`` with
+configurable latency, jitter, dropped commands and spontaneous manual flips.
+Everything runs inside the test event loop, so no network access is needed.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+import random
+import time
+
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.util import slugify
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.controllable.const import (
+    ATTR_IS_SYNCED,
+    CONF_NAME,
+    CONF_TARGET_DEVICE,
+    DOMAIN,
+)
+
+FAKE_DOMAIN = "fake_device"
+
+
+@dataclass
+class FakeDeviceProfile:
+    """Behaviour of the simulated devices.
+
+    Attributes:
+        latency: Base delay in seconds before a command takes effect.
+        jitter: Maximum extra random delay in seconds added to the latency.
+        drop_rate: Probability between 0 and 1 that a command is ignored.
+        seed: Seed for the random generator, for reproducible runs.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    drop_rate: float = 0.0
+    seed: int | None = 0
+
+
+@dataclass
+class FakeDevice:
+    """A simulated device exposing a single controllable entity."""
+
+    device_id: str
+    entity_id: str
+
+
+class FakeDevicePlatform:
+    """Stand-in for real devices driven through Home Assistant services."""
+
+    def __init__(self, hass: HomeAssistant, profile: FakeDeviceProfile) -> None:
+        """Initialize the platform.
+
+        Args:
+            hass: The Home Assistant instance.
+            profile: The latency and failure behaviour to simulate.
+        """
+        self.hass = hass
+        self.profile = profile
+        self.commands = 0
+        self.dropped: list[float] = []
+        self.manual_flips: list[float] = []
+        self._random = random.Random(profile.seed)  # nosec B311
+        self._config_entry = MockConfigEntry(domain=FAKE_DOMAIN)
+        self._config_entry.add_to_hass(hass)
+
+    @callback
+    def async_register_services(self) -> None:
+        """Register the generic turn_on/turn_off services used by Controllable."""
+        for service in ("turn_on", "turn_off"):
+            self.hass.services.async_register(
+                "homeassistant", service, self._async_handle_command
+            )
+
+    @callback
+    def async_add_device(
+        self, domain: str, name: str, initial_state: str = "off"
+    ) -> FakeDevice:
+        """Create a device with one switch, light or fan entity.
+
+        Args:
+            domain: The entity domain, one of switch, light or fan.
+            name: The device name.
+            initial_state: The initial state of the entity.
+
+        Returns:
+            The created device.
+        """
+        device = dr.async_get(self.hass).async_get_or_create(
+            config_entry_id=self._config_entry.entry_id,
+            identifiers={(FAKE_DOMAIN, slugify(name))},
+            name=name,
+        )
+        entity = er.async_get(self.hass).async_get_or_create(
+            domain,
+            FAKE_DOMAIN,
+            slugify(name),
+            config_entry=self._config_entry,
+            device_id=device.id,
+            suggested_object_id=slugify(name),
+        )
+        self.hass.states.async_set(entity.entity_id, initial_state)
+        return FakeDevice(device_id=device.id, entity_id=entity.entity_id)
+
+    @callback
+    def async_manual_flip(self, entity_id: str) -> None:
+        """Toggle an entity as if someone operated the device by hand.
+
+        Args:
+            entity_id: The entity to toggle.
+        """
+        state = self.hass.states.get(entity_id)
+        new_state = "off" if state and state.state == "on" else "on"
+        self.manual_flips.append(time.perf_counter())
+        self.hass.states.async_set(entity_id, new_state, context=Context())
+
+    @callback
+    def async_start_manual_flips(
+        self, entity_id: str, interval: float
+    ) -> CALLBACK_TYPE:
+        """Flip an entity repeatedly at a jittered interval.
+
+        Args:
+            entity_id: The entity to toggle.
+            interval: Mean delay in seconds between flips.
+
+        Returns:
+            A callback that stops the flips.
+        """
+        handle: asyncio.TimerHandle | None = None
+
+        @callback
+        def _flip() -> None:
+            nonlocal handle
+            self.async_manual_flip(entity_id)
+            handle = self.hass.loop.call_later(self._next_interval(interval), _flip)
+
+        @callback
+        def _stop() -> None:
+            if handle is not None:
+                handle.cancel()
+
+        handle = self.hass.loop.call_later(self._next_interval(interval), _flip)
+        return _stop
+
+    def _next_interval(self, interval: float) -> float:
+        """Return a flip interval drawn uniformly around the mean."""
+        return self._random.uniform(interval / 2, interval * 3 / 2)
+
+    async def _async_handle_command(self, call: ServiceCall) -> None:
+        """Apply a turn_on/turn_off command after the simulated delay."""
+        self.commands += 1
+        if self._random.random() < self.profile.drop_rate:
+            self.dropped.append(time.perf_counter())
+            return
+
+        delay = self.profile.latency + self._random.uniform(0, self.profile.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        new_state = "on" if call.service == "turn_on" else "off"
+        entity_ids = call.data["entity_id"]
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        for entity_id in entity_ids:
+            self.hass.states.async_set(entity_id, new_state, context=call.context)
+
+
+async def async_setup_controllable(hass: HomeAssistant, device: FakeDevice) -> str:
+    """Set up a controllable for a fake device and return its entity ID.
+
+    Args:
+        hass: The Home Assistant instance.
+        device: The fake device to control.
+
+    Returns:
+        The entity ID of the controllable switch.
+    """
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Controllable",
+        data={CONF_NAME: "Controllable", CONF_TARGET_DEVICE: device.device_id},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "switch", DOMAIN, f"{entry.entry_id}_Controllable"
+    )
+    assert entity_id is not None
+    return entity_id
+
+
+@dataclass
+class SyncProbe:
+    """Records state and sync transitions of a controllable and its target.
+
+    Attributes:
+        controllable: The controllable switch entity ID.
+        target: The target entity ID.
+        sync_changes: Timestamped ``is_synced`` values of the controllable.
+        target_changes: Timestamped states of the target entity.
+    """
+
+    controllable: str
+    target: str
+    sync_changes: list[tuple[float, bool]] = field(default_factory=list)
+    target_changes: list[tuple[float, str]] = field(default_factory=list)
+
+    @callback
+    def async_attach(self, hass: HomeAssistant) -> CALLBACK_TYPE:
+        """Start recording state changes.
+
+        Args:
+            hass: The Home Assistant instance.
+
+        Returns:
+            A callback that stops recording.
+        """
+
+        @callback
+        def _state_changed(event: Event) -> None:
+            now = time.perf_counter()
+            new_state = event.data.get("new_state")
+            if new_state is None:
+                return
+            if new_state.entity_id == self.target:
+                self.target_changes.append((now, new_state.state))
+            elif new_state.entity_id == self.controllable:
+                is_synced = new_state.attributes.get(ATTR_IS_SYNCED)
+                if not self.sync_changes or self.sync_changes[-1][1] != is_synced:
+                    self.sync_changes.append((now, is_synced))
+
+        return hass.bus.async_listen("state_changed", _state_changed)
+
+    def first_target_change(self, since: float, state: str) -> float | None:
+        """Return when the target first reached a state after a given time."""
+        return next(
+            (t for t, value in self.target_changes if t >= since and value == state),
+            None,
+        )
+
+    def first_desync(self, since: float) -> float | None:
+        """Return when the controllable first reported a desync after a time."""
+        return next(
+            (t for t, synced in self.sync_changes if t >= since and not synced),
+            None,
+        )
+
+    def desync_episodes(self) -> list[tuple[float, float | None]]:
+        """Return (start, end) pairs of periods where sync was lost.
+
+        The end is None if the controllable is still out of sync.
+        """
+        episodes: list[tuple[float, float | None]] = []
+        start: float | None = None
+        for t, synced in self.sync_changes:
+            if not synced and start is None:
+                start = t
+            elif synced and start is not None:
+                episodes.append((start, t))
+                start = None
+        if start is not None:
+            episodes.append((start, None))
+        return episodes
+
+    def unexplained_desyncs(
+        self, injected: list[float]
+    ) -> list[tuple[float, float | None]]:
+        """Return desync periods not explained by an injected fault.
+
+        Args:
+            injected: Times of manual flips and dropped commands.
+
+        Returns:
+            The (start, end) pairs of desync periods containing no fault.
+        """
+        unexplained = []
+        for start, end in self.desync_episodes():
+            # Manual flips are recorded just before the state they cause.
+            window_end = end if end is not None else float("inf")
+            if not any(start - 0.001 <= t <= window_end for t in injected):
+                unexplained.append((start, end))
+        return unexplained
+
+    def false_desyncs(self, injected: list[float]) -> int:
+        """Count desync periods not explained by an injected fault."""
+        return len(self.unexplained_desyncs(injected))
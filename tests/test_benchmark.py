@@ -0,0 +1,124 @@
+"""Startup benchmarks for the Controllable integration.
+
+Run with ``pytest tests/test_benchmark.py -m slow -s`` to print the report.
+"""
+
+from pathlib import Path
+from statistics import median
+import subprocess
+import sys
+import time
+
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.controllable.const import CONF_NAME, CONF_TARGET_DEVICE, DOMAIN
+
+from .fake_device import FakeDevicePlatform, FakeDeviceProfile
+
+# Home Assistant modules that are always loaded before a custom integration,
+# so they are imported first and excluded from the measured cost.
+PRELOADED_MODULES = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.entity_platform",
+)
+
+MEASURED_MODULES = (
+    "custom_components.controllable",
+    "custom_components.controllable.switch",
+    "custom_components.controllable.config_flow",
+)
+
+SETUP_ROUNDS = 50
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _measure_import_times() -> dict[str, int]:
+    """Return cumulative import time in microseconds per measured module.
+
+    Each module is imported in a fresh interpreter with ``-X importtime`` so
+    that results are not skewed by modules cached in the test process.
+    """
+    results: dict[str, int] = {}
+    for module in MEASURED_MODULES:
+        code = "; ".join(f"import {name}" for name in (*PRELOADED_MODULES, module))
+        proc = subprocess.run(  # nosec B603
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for line in proc.stderr.splitlines():
+            # Format: "import time: <self> | <cumulative> | <indent><name>"
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                results[module] = int(parts[1].strip())
+    return results
+
+
+@pytest.mark.slow
+def test_import_time(record_property):
+    """Report the import cost of the integration modules."""
+    results = _measure_import_times()
+
+    print("\nImport time (cumulative, excluding Home Assistant core):")
+    for module in MEASURED_MODULES:
+        print(f"  {module}: {results[module] / 1000:.2f} ms")
+        record_property(f"import_us[{module}]", results[module])
+
+    assert set(results) == set(MEASURED_MODULES)
+
+
+@pytest.mark.slow
+async def test_setup_entry_wall_time(
+    hass: HomeAssistant, enable_custom_integrations, record_property
+):
+    """Report the wall time of setting up and unloading a config entry.
+
+    Each round runs the full path Home Assistant takes at startup, including
+    forwarding to the switch platform and registry lookups. The first round
+    also loads the integration and the switch component, so it is reported
+    separately.
+    """
+    platform = FakeDevicePlatform(hass, FakeDeviceProfile())
+    device = platform.async_add_device("switch", "Bench switch")
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Bench",
+        data={CONF_NAME: "Bench", CONF_TARGET_DEVICE: device.device_id},
+    )
+    entry.add_to_hass(hass)
+
+    setup_times: list[float] = []
+    unload_times: list[float] = []
+    listeners: set[int] = set()
+    for _ in range(SETUP_ROUNDS):
+        start = time.perf_counter()
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        setup_times.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+        unload_times.append((time.perf_counter() - start) * 1000)
+        listeners.add(hass.bus.async_listeners().get("state_changed", 0))
+
+    first_setup_ms = setup_times[0]
+    setup_ms = median(setup_times[1:])
+    unload_ms = median(unload_times[1:])
+
+    print(f"\nConfig entry wall time ({SETUP_ROUNDS} setup/unload rounds):")
+    print(f"  first setup: {first_setup_ms:.3f} ms")
+    print(f"  setup (median): {setup_ms:.3f} ms")
+    print(f"  unload (median): {unload_ms:.3f} ms")
+    record_property("first_setup_entry_ms", first_setup_ms)
+    record_property("setup_entry_ms", setup_ms)
+    record_property("unload_entry_ms", unload_ms)
+
+    # Repeated setup and unload must not leave listeners behind.
+    assert len(listeners) == 1
@@ -0,0 +1,47 @@
+"""Test Controllable diagnostics."""
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.controllable.const import DOMAIN
+from custom_components.controllable.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+from .fake_device import (
+    FakeDevicePlatform,
+    FakeDeviceProfile,
+    async_setup_controllable,
+)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable loading the integration from custom_components."""
+    yield
+
+
+async def test_diagnostics_include_history(hass: HomeAssistant):
+    """Test that diagnostics include the sync history of the entry's switch."""
+    platform = FakeDevicePlatform(hass, FakeDeviceProfile())
+    platform.async_register_services()
+    device = platform.async_add_device("switch", "Fake switch")
+    controllable = await async_setup_controllable(hass, device)
+
+    await hass.services.async_call(
+        "switch", "turn_on", {"entity_id": controllable}, blocking=True
+    )
+    await hass.async_block_till_done()
+    platform.async_manual_flip(device.entity_id)
+    await hass.async_block_till_done()
+
+    entry = hass.config_entries.async_entries(DOMAIN)[0]
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["config_entry"]["entry_id"] == entry.entry_id
+    history = diagnostics["history"][controllable]
+    assert history[0]["origin"] == "other"
+    assert (history[0]["old_state"], history[0]["new_state"]) == ("on", "off")
+    assert history[0]["is_synced"] is False
+    assert history[1]["origin"] == "controllable"
+    assert (history[1]["old_state"], history[1]["new_state"]) == ("off", "on")
@@ -0,0 +1,294 @@
+"""End-to-end tests against simulated devices.
+
+These drive the real config entry setup and ControllableSwitch service path
+and measure command latency, override detection time and false desyncs.
+"""
+
+from statistics import mean
+import time
+from typing import Any
+
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+import pytest
+from pytest_homeassistant_custom_component.common import MockUser
+
+from custom_components.controllable.const import (
+    ATTR_IS_SYNCED,
+    DOMAIN,
+    SERVICE_GET_HISTORY,
+)
+
+from .fake_device import (
+    FakeDevicePlatform,
+    FakeDeviceProfile,
+    SyncProbe,
+    async_setup_controllable,
+)
+
+pytestmark = pytest.mark.integration
+
+CONTROLLABLE_DOMAINS = ("switch", "light", "fan")
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable loading the integration from custom_components."""
+    yield
+
+
+async def _async_command(hass: HomeAssistant, entity_id: str, service: str) -> float:
+    """Call a service on the controllable and wait for the device to settle.
+
+    Returns:
+        The time at which the command was issued.
+    """
+    start = time.perf_counter()
+    await hass.services.async_call(
+        "switch", service, {"entity_id": entity_id}, blocking=True
+    )
+    await hass.async_block_till_done()
+    return start
+
+
+async def _async_get_history(
+    hass: HomeAssistant, entity_id: str
+) -> list[dict[str, Any]]:
+    """Return the sync history of a controllable through the service."""
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        {"entity_id": entity_id},
+        blocking=True,
+        return_response=True,
+    )
+    return response[entity_id]
+
+
+@pytest.mark.parametrize("domain", CONTROLLABLE_DOMAINS)
+async def test_command_round_trip_latency(
+    hass: HomeAssistant, domain: str, record_property
+):
+    """Test that commands reach the device and the controllable resyncs."""
+    profile = FakeDeviceProfile(latency=0.01, jitter=0.005)
+    platform = FakeDevicePlatform(hass, profile)
+    platform.async_register_services()
+    device = platform.async_add_device(domain, f"Fake {domain}")
+    controllable = await async_setup_controllable(hass, device)
+
+    probe = SyncProbe(controllable, device.entity_id)
+    unsub = probe.async_attach(hass)
+
+    latencies = []
+    for service, expected in [("turn_on", "on"), ("turn_off", "off")] * 5:
+        start = await _async_command(hass, controllable, service)
+        reached = probe.first_target_change(start, expected)
+        assert reached is not None
+        latencies.append(reached - start)
+
+        assert hass.states.get(device.entity_id).state == expected
+        assert hass.states.get(controllable).attributes[ATTR_IS_SYNCED] is True
+
+    unsub()
+
+    assert min(latencies) >= profile.latency
+    record_property("mean_latency_ms", mean(latencies) * 1000)
+    record_property("max_latency_ms", max(latencies) * 1000)
+
+
+async def test_override_detection_time(hass: HomeAssistant, record_property):
+    """Test that a manual change on the device is detected as a desync."""
+    platform = FakeDevicePlatform(hass, FakeDeviceProfile())
+    platform.async_register_services()
+    device = platform.async_add_device("light", "Fake light")
+    controllable = await async_setup_controllable(hass, device)
+    await _async_command(hass, controllable, "turn_on")
+    assert hass.states.get(controllable).attributes[ATTR_IS_SYNCED] is True
+
+    probe = SyncProbe(controllable, device.entity_id)
+    unsub = probe.async_attach(hass)
+
+    detection_times = []
+    for _ in range(5):
+        platform.async_manual_flip(device.entity_id)
+        await hass.async_block_till_done()
+        flipped_at = platform.manual_flips[-1]
+        detected = probe.first_desync(flipped_at)
+        assert detected is not None
+        detection_times.append(detected - flipped_at)
+
+        assert hass.states.get(controllable).attributes[ATTR_IS_SYNCED] is False
+        # Flip back so the next round starts from a synced state.
+        platform.async_manual_flip(device.entity_id)
+        await hass.async_block_till_done()
+        assert hass.states.get(controllable).attributes[ATTR_IS_SYNCED] is True
+
+    unsub()
+
+    record_property("max_override_detection_ms", max(detection_times) * 1000)
+
+
+async def test_dropped_command_reported_as_desync(hass: HomeAssistant):
+    """Test that a command the device never applies leaves the switch unsynced."""
+    platform = FakeDevicePlatform(hass, FakeDeviceProfile(drop_rate=1.0))
+    platform.async_register_services()
+    device = platform.async_add_device("fan", "Fake fan")
+    controllable = await async_setup_controllable(hass, device)
+
+    probe = SyncProbe(controllable, device.entity_id)
+    unsub = probe.async_attach(hass)
+
+    await _async_command(hass, controllable, "turn_on")
+    unsub()
+
+    assert hass.states.get(device.entity_id).state == "off"
+    assert hass.states.get(controllable).attributes[ATTR_IS_SYNCED] is False
+    assert len(platform.dropped) == 1
+    assert probe.false_desyncs(platform.dropped) == 0
+
+    # The desync is recorded even though the target never changed.
+    history = await _async_get_history(hass, controllable)
+    assert len(history) == 1
+    assert history[0]["origin"] == "controllable"
+    assert (history[0]["old_state"], history[0]["new_state"]) == ("off", "off")
+    assert history[0]["is_synced"] is False
+
+
+async def test_false_desync_rate(hass: HomeAssistant, record_property):
+    """Measure desyncs not caused by overrides or drops under noisy devices."""
+    profile = FakeDeviceProfile(latency=0.005, jitter=0.005, drop_rate=0.1, seed=42)
+    platform = FakeDevicePlatform(hass, profile)
+    platform.async_register_services()
+    device = platform.async_add_device("switch", "Fake switch")
+    controllable = await async_setup_controllable(hass, device)
+
+    probe = SyncProbe(controllable, device.entity_id)
+    unsub = probe.async_attach(hass)
+    stop_flips = platform.async_start_manual_flips(device.entity_id, interval=0.05)
+
+    for service in ["turn_on", "turn_off"] * 10:
+        await _async_command(hass, controllable, service)
+
+    stop_flips()
+    unsub()
+
+    injected = platform.dropped + platform.manual_flips
+    false_desyncs = probe.false_desyncs(injected)
+    record_property("false_desync_rate", false_desyncs / platform.commands)
+
+    assert platform.commands == 20
+    # Every desync must be explained by a manual flip or a dropped command.
+    assert false_desyncs == 0
+
+
+async def test_get_history_service(hass: HomeAssistant):
+    """Test that the history service attributes commands and overrides."""
+    platform = FakeDevicePlatform(hass, FakeDeviceProfile(latency=0.01))
+    platform.async_register_services()
+    device = platform.async_add_device("switch", "Fake switch")
+    controllable = await async_setup_controllable(hass, device)
+
+    await _async_command(hass, controllable, "turn_on")
+    platform.async_manual_flip(device.entity_id)
+    await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        {"entity_id": controllable},
+        blocking=True,
+        return_response=True,
+    )
+
+    # No pending desync is recorded while the device applies the command.
+    override, command = response[controllable]
+    assert command["origin"] == "controllable"
+    assert (command["old_state"], command["new_state"]) == ("off", "on")
+    assert command["is_synced"] is True
+    assert override["origin"] == "other"
+    assert (override["old_state"], override["new_state"]) == ("on", "off")
+    assert override["is_synced"] is False
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        {"entity_id": controllable, "limit": 1},
+        blocking=True,
+        return_response=True,
+    )
+    assert response[controllable] == [override]
+
+    with pytest.raises(ServiceValidationError) as err:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_HISTORY,
+            {"entity_id": device.entity_id},
+            blocking=True,
+            return_response=True,
+        )
+    assert err.value.translation_key == "not_controllable"
+    assert err.value.translation_placeholders == {"entity_id": device.entity_id}
+
+
+async def test_history_records_user_of_command(
+    hass: HomeAssistant, hass_admin_user: MockUser
+):
+    """Test that a command's record keeps the user who operated the switch."""
+    platform = FakeDevicePlatform(hass, FakeDeviceProfile())
+    platform.async_register_services()
+    device = platform.async_add_device("switch", "Fake switch")
+    controllable = await async_setup_controllable(hass, device)
+
+    await hass.services.async_call(
+        "switch",
+        "turn_on",
+        {"entity_id": controllable},
+        blocking=True,
+        context=Context(user_id=hass_admin_user.id),
+    )
+    await hass.async_block_till_done()
+
+    (command,) = await _async_get_history(hass, controllable)
+    assert command["origin"] == "controllable"
+    assert command["user_id"] == hass_admin_user.id
+    assert hass.states.get(device.entity_id).context.parent_id is not None
+
+
+async def test_history_skips_attribute_updates(hass: HomeAssistant):
+    """Test that attribute-only target updates are not recorded."""
+    platform = FakeDevicePlatform(hass, FakeDeviceProfile())
+    platform.async_register_services()
+    device = platform.async_add_device("light", "Fake light", initial_state="on")
+    controllable = await async_setup_controllable(hass, device)
+
+    for brightness in range(0, 255, 5):
+        hass.states.async_set(device.entity_id, "on", {"brightness": brightness})
+    await hass.async_block_till_done()
+
+    assert await _async_get_history(hass, controllable) == []
+    assert hass.states.get(controllable).attributes[ATTR_IS_SYNCED] is True
+
+
+async def test_overlapping_commands_attributed_to_switch(hass: HomeAssistant):
+    """Test that a delayed change from an earlier command is not misattributed."""
+    platform = FakeDevicePlatform(hass, FakeDeviceProfile(latency=0.05))
+    platform.async_register_services()
+    device = platform.async_add_device("switch", "Fake switch")
+    controllable = await async_setup_controllable(hass, device)
+
+    # Send the second command before the device has applied the first one.
+    for service in ("turn_on", "turn_off"):
+        await hass.services.async_call("switch", service, {"entity_id": controllable})
+    await hass.async_block_till_done()
+
+    changes = [
+        record
+        for record in await _async_get_history(hass, controllable)
+        if record["old_state"] != record["new_state"]
+    ]
+    assert [(r["old_state"], r["new_state"]) for r in changes] == [
+        ("on", "off"),
+        ("off", "on"),
+    ]
+    assert all(r["origin"] == "controllable" for r in changes)
+    assert hass.states.get(controllable).attributes[ATTR_IS_SYNCED] is True
@@ -0,0 +1,66 @@
+"""Test Controllable sync history."""
+
+from homeassistant.core import Context
+import pytest
+
+from custom_components.controllable.history import SyncHistory, classify_origin
+
+
+def test_history_newest_first():
+    """Test that records are returned newest first."""
+    history = SyncHistory(5)
+    history.record(1.0, "off", "on", True, "controllable")
+    history.record(2.0, "on", "off", False, "user", "user_123")
+
+    records = history.as_list()
+
+    assert len(history) == 2
+    assert [r["new_state"] for r in records] == ["off", "on"]
+    assert records[0]["origin"] == "user"
+    assert records[0]["user_id"] == "user_123"
+    assert records[0]["is_synced"] is False
+    assert records[1]["timestamp"] == "1970-01-01T00:00:01+00:00"
+
+
+def test_history_overwrites_oldest():
+    """Test that a full buffer drops its oldest records."""
+    history = SyncHistory(3)
+    for i in range(5):
+        history.record(float(i), "off", "on", True, "other")
+
+    records = history.as_list()
+
+    assert len(history) == 3
+    assert [r["timestamp"][-9:-6] for r in records] == [":04", ":03", ":02"]
+
+
+def test_history_limit_and_unknown_states():
+    """Test the limit argument and states outside on/off."""
+    history = SyncHistory(3)
+    history.record(1.0, None, "unavailable", False, "other")
+    history.record(2.0, "unavailable", "buffering", False, "other")
+
+    records = history.as_list(limit=1)
+
+    assert len(records) == 1
+    assert records[0]["old_state"] == "unavailable"
+    assert records[0]["new_state"] == "unknown"
+
+
+def test_history_size_must_be_positive():
+    """Test that an empty buffer is rejected."""
+    with pytest.raises(ValueError):
+        SyncHistory(0)
+
+
+def test_classify_origin():
+    """Test attribution of state changes."""
+    own = Context()
+
+    recent = [Context().id, own.id]
+
+    assert classify_origin(own, recent) == "controllable"
+    assert classify_origin(Context(user_id="user_123"), recent) == "user"
+    assert classify_origin(Context(parent_id="parent"), recent) == "automation"
+    assert classify_origin(Context(), recent) == "other"
+    assert classify_origin(own, []) == "other"
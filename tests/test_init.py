@@ -57,6 +57,7 @@ async def test_unload_without_setup(hass: HomeAssistant):
     config_entry.entry_id = "test_entry"
     config_entry.domain = "controllable"
     config_entry.title = "Test Controllable"
+    config_entry.data = {"name": "Test", "target_device": "device_123"}
 
     # Mock the unload_platforms to return False
     with patch.object(
@@ -66,8 +67,8 @@ async def test_unload_without_setup(hass: HomeAssistant):
         assert result is False
 
 
-async def test_state_change_listener(hass: HomeAssistant):
-    """Test that state change events are listened to."""
+async def test_setup_adds_no_state_change_listener(hass: HomeAssistant):
+    """Test that setup leaves target tracking to the switch entities."""
     config_entry = MagicMock(spec=ConfigEntry)
     config_entry.entry_id = "test_entry"
     config_entry.domain = "controllable"
@@ -76,16 +77,38 @@ async def test_state_change_listener(hass: HomeAssistant):
         "name": "Test",
         "target_entity": "switch.test",
     }
+    listeners_before = hass.bus.async_listeners().get("state_changed", 0)
 
     with patch.object(
         hass.config_entries, "async_forward_entry_setups", return_value=None
     ):
         await async_setup_entry(hass, config_entry)
 
-        # Check that the listener was added (basic check)
         assert config_entry.entry_id in hass.data.get("controllable", {})
+        assert hass.bus.async_listeners().get("state_changed", 0) == listeners_before
 
         with patch.object(
             hass.config_entries, "async_unload_platforms", return_value=True
         ):
             await async_unload_entry(hass, config_entry)
+
+        assert config_entry.entry_id not in hass.data["controllable"]
+
+
+async def test_setup_forwards_platform_only_with_target_device(hass: HomeAssistant):
+    """Test that the switch platform is only forwarded for entries with a device."""
+    config_entry = MagicMock(spec=ConfigEntry)
+    config_entry.entry_id = "test_entry"
+    config_entry.domain = "controllable"
+    config_entry.title = "Test Controllable"
+    config_entry.data = {"name": "Test"}
+
+    with patch.object(
+        hass.config_entries, "async_forward_entry_setups", return_value=None
+    ) as mock_forward:
+        await async_setup_entry(hass, config_entry)
+        mock_forward.assert_not_called()
+
+        config_entry.data = {"name": "Test", "target_device": "device_123"}
+        await async_setup_entry(hass, config_entry)
+        mock_forward.assert_called_once_with(config_entry, ["switch"])
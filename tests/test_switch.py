@@ -1,6 +1,6 @@
 """Test Controllable switch."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 from homeassistant.components.switch import SwitchDeviceClass
 from homeassistant.core import HomeAssistant
@@ -113,6 +113,8 @@ async def test_switch_turn_on(hass: HomeAssistant):
             "homeassistant",
             "turn_on",
             {"entity_id": "switch.test_target"},
+            blocking=True,
+            context=ANY,
         )
         assert switch._is_synced is True
 
@@ -140,6 +142,8 @@ async def test_switch_turn_off(hass: HomeAssistant):
             "homeassistant",
             "turn_off",
             {"entity_id": "switch.test_target"},
+            blocking=True,
+            context=ANY,
         )
         assert switch._is_synced is True
         assert switch._is_on is False